@@ -33,8 +33,20 @@ Tests for `wikiparserlib` module.
 
 """
 
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+
 from betamax.fixtures import unittest
 
+from wikiparserlib import WikipediaSeries
+from wikiparserlib.config import UNTITLED_SEASON_FOLDER
+from wikiparserlib.wikiparserlib import MAX_PENDING_SEASON_WRITES, SearchResult, Season
+
 __author__ = '''Niko Izsak <izsak.niko@gmail.com>'''
 __docformat__ = '''google'''
 __date__ = '''28-02-2021'''
@@ -45,6 +57,31 @@ __maintainer__ = '''Niko Izsak'''
 __email__ = '''<izsak.niko@gmail.com>'''
 __status__ = '''Development'''  # "Prototype", "Development", "Production".
 
+EPISODE_LIST_HTML = b"""<html><body><div class="mw-parser-output">
+<h2><span class="mw-headline" id="Series_overview">Series overview</span></h2>
+<table class="wikitable plainrowheaders"><tbody><tr><th><a href="#Season_1">1</a></th></tr></tbody></table>
+<h2><span class="mw-headline" id="Episodes">Episodes</span></h2>
+<h3><span class="mw-headline" id="Season_1">Season 1 (2020)</span><span class="mw-editsection">[edit]</span></h3>
+<table class="wikitable plainrowheaders wikiepisodetable"><tbody>
+<tr><th scope="col">No.</th><th scope="col">Title</th><th scope="col">Original air date</th></tr>
+<tr class="vevent"><th scope="row">1</th><td class="summary">"Pilot"</td><td>January 1, 2020</td></tr>
+<tr class="expand-child"><td colspan="3">A summary of the pilot.</td></tr>
+<tr class="vevent module-episode-list-row"><th scope="row">2</th><td class="summary">"Second"</td>
+<td>January 8, 2020</td></tr>
+</tbody></table>
+<div class="mw-heading mw-heading3"><h3 id="Season_2">Season 2 (2021)</h3></div>
+<p>The second season.</p>
+<table class="wikitable plainrowheaders wikiepisodetable"><tbody>
+<tr><th scope="col">No.</th><th scope="col">Title</th><th scope="col">Original air date</th></tr>
+<tr class="vevent"><th scope="row">3</th><td class="summary">"Third"</td><td>January 1, 2021</td></tr>
+</tbody></table>
+<h2><span class="mw-headline" id="Specials">Specials</span></h2>
+<table class="wikitable plainrowheaders wikiepisodetable"><tbody>
+<tr><th scope="col">Title</th><th scope="col">Original air date</th></tr>
+<tr class="vevent"><td class="summary">"Holiday special"</td><td>December 24, 2021</td></tr>
+</tbody></table>
+</div></body></html>"""
+
 
 class TestWikiparserlib(unittest.BetamaxTestCase):
 
@@ -63,3 +100,189 @@ class TestWikiparserlib(unittest.BetamaxTestCase):
         This is where you should tear down what you've setup in setUp before. This method is called after every test.
         """
         pass
+
+    def test_seasons_are_paired_with_the_preceding_heading(self):
+        series = WikipediaSeries()
+        seasons = list(series._iter_seasons_and_episodes_from_html(EPISODE_LIST_HTML))
+        self.assertEqual([season.number for season in seasons], ['Season 1 (2020)', 'Season 2 (2021)', 'Specials'])
+
+    def test_miniseries_tables_are_titled_miniseries(self):
+        series = WikipediaSeries()
+        series.query_type = 'miniseries'
+        seasons = list(series._iter_seasons_and_episodes_from_html(EPISODE_LIST_HTML))
+        self.assertEqual([season.number for season in seasons], ['Miniseries'] * 3)
+
+    def test_episode_rows_are_keyed_by_column_headers(self):
+        series = WikipediaSeries()
+        first_season, _, specials = series._iter_seasons_and_episodes_from_html(EPISODE_LIST_HTML)
+        self.assertEqual(json.loads(first_season.episodes),
+                         [{'No.': '1', 'Title': 'Pilot', 'Original air date': 'January 1, 2020'},
+                          {'No.': '2', 'Title': 'Second', 'Original air date': 'January 8, 2020'}])
+        self.assertEqual(json.loads(specials.episodes),
+                         [{'Title': 'Holiday special', 'Original air date': 'December 24, 2021'}])
+
+    @staticmethod
+    def _get_results(query, *titles):
+        return [SearchResult(title, f'https://en.wikipedia.org/wiki/{title}', query, None) for title in titles]
+
+    def test_exact_title_matches(self):
+        results = self._get_results('Chernobyl', 'Chernobyl', 'Chernobyl disaster')
+        self.assertEqual(WikipediaSeries._check_for_match_in_result(results), results[0])
+
+    def test_title_differing_in_case_and_whitespace_matches(self):
+        results = self._get_results('list of foo episodes', ' List of Foo episodes', 'Foo')
+        self.assertEqual(WikipediaSeries._check_for_match_in_result(results), results[0])
+
+    def test_disambiguated_title_matches(self):
+        results = self._get_results('Lost', 'Lost (TV series)', 'Lost in Space')
+        self.assertEqual(WikipediaSeries._check_for_match_in_result(results), results[0])
+
+    def test_title_only_starting_with_the_query_does_not_match(self):
+        self.assertFalse(WikipediaSeries._check_for_match_in_result(self._get_results('Bar', 'Barn', 'Bar')))
+        self.assertFalse(WikipediaSeries._check_for_match_in_result(self._get_results('lost', 'Lost in Space', 'Lost')))
+
+    def test_single_result_matches(self):
+        results = self._get_results('Foo', 'Something else')
+        self.assertEqual(WikipediaSeries._check_for_match_in_result(results), results[0])
+
+    def test_no_results_do_not_match(self):
+        self.assertFalse(WikipediaSeries._check_for_match_in_result([]))
+
+    def test_failed_search_is_not_an_error_when_another_query_type_matched(self):
+        series = WikipediaSeries()
+        results = self._get_results('list of Foo episodes', 'List of Foo episodes')
+        with mock.patch.object(series, '_logger') as logger:
+            picked = series._pick_search_result([('episode_list', results), ('miniseries', None), ('name', [])])
+        self.assertEqual(picked, results)
+        self.assertEqual(series.title, 'Foo')
+        logger.error.assert_not_called()
+
+    def test_failed_searches_are_an_error_when_no_query_type_returned_results(self):
+        series = WikipediaSeries()
+        with self.assertLogs('wikiparserlib.WikipediaSeries', 'ERROR') as logs:
+            picked = series._pick_search_result([('episode_list', None), ('miniseries', []), ('name', None)])
+        self.assertEqual(picked, [])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('episode_list, name', logs.output[0])
+
+
+class TestWriteToFileSystem(unittest.BetamaxTestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        Points the results directory to a temporary folder that is removed after every test.
+        """
+        self.results_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.results_directory, ignore_errors=True)
+        patcher = mock.patch('wikiparserlib.wikiparserlib.RESULTS_DIRECTORY', self.results_directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.series = WikipediaSeries()
+        self.series.title = 'Foo'
+
+    def tearDown(self):
+        """
+        Test tear down
+
+        The temporary results folder is removed by the cleanups registered in setUp.
+        """
+        pass
+
+    @staticmethod
+    def _get_season(number, episodes):
+        season = Season(number)
+        season.episodes = json.dumps(episodes)
+        return season
+
+    def _write(self, *seasons):
+        asyncio.run(self.series._write_async(iter(seasons)))
+
+    def _read_series(self, title='Foo'):
+        series_directory = os.path.join(self.results_directory, title)
+        seasons = {}
+        for folder in os.listdir(series_directory):
+            with open(os.path.join(series_directory, folder, 'episodes.json'), encoding='utf-8') as episodes_file:
+                seasons[folder] = json.load(episodes_file)
+        return seasons
+
+    def _get_hidden_folders(self):
+        """Wait for the replaced series folders to be deleted in the background and return the ones left."""
+        for _ in range(100):
+            hidden_folders = [name for name in os.listdir(self.results_directory) if name.startswith('.')]
+            if not hidden_folders:
+                break
+            time.sleep(0.01)
+        return hidden_folders
+
+    def test_seasons_are_written_as_json(self):
+        self._write(self._get_season('Season 1', [1, 2]), self._get_season('Season 2', [3]))
+        self.assertEqual(self._read_series(), {'Season 1': [1, 2], 'Season 2': [3]})
+        self.assertEqual(self._get_hidden_folders(), [])
+
+    def test_last_season_with_a_duplicate_title_wins(self):
+        self._write(*(self._get_season('Miniseries', [number]) for number in range(3)))
+        self.assertEqual(self._read_series(), {'Miniseries': [2]})
+
+    def test_untitled_season_is_written_to_the_untitled_folder(self):
+        self._write(self._get_season(None, [1]))
+        self.assertEqual(self._read_series(), {UNTITLED_SEASON_FOLDER: [1]})
+
+    def test_existing_series_folder_is_replaced(self):
+        self._write(self._get_season('Season 1', [1]), self._get_season('Old season', [2]))
+        self._write(self._get_season('Season 1', [3]))
+        self.assertEqual(self._read_series(), {'Season 1': [3]})
+        self.assertEqual(self._get_hidden_folders(), [])
+
+    def test_failed_write_keeps_the_existing_series_folder(self):
+        self._write(self._get_season('Season 1', [1]))
+        broken_season = Season('Season 2')
+        broken_season.episodes = None
+        with self.assertRaises(TypeError):
+            self._write(self._get_season('Season 1', [2]), broken_season)
+        self.assertEqual(self._read_series(), {'Season 1': [1]})
+        self.assertEqual(self._get_hidden_folders(), [])
+
+    def test_failed_move_restores_the_existing_series_folder(self):
+        self._write(self._get_season('Season 1', [1]))
+        new_directory = tempfile.mkdtemp(dir=self.results_directory)
+        replace = os.replace
+        calls = []
+
+        def fail_moving_the_new_folder_in(source, destination):
+            calls.append(source)
+            if source == new_directory:
+                raise OSError('move failed')
+            replace(source, destination)
+
+        with mock.patch('wikiparserlib.wikiparserlib.os.replace', side_effect=fail_moving_the_new_folder_in):
+            with self.assertRaises(OSError):
+                self.series._replace_dir_tree(new_directory, os.path.join(self.results_directory, 'Foo'))
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(self._read_series(), {'Season 1': [1]})
+
+    def test_title_with_a_slash_is_written_to_nested_folders(self):
+        self.series.title = 'Love/Hate'
+        self._write(self._get_season('Season 1', [1]))
+        self._write(self._get_season('Season 1', [2]))
+        self.assertEqual(self._read_series('Love/Hate'), {'Season 1': [2]})
+        self.assertEqual(self._get_hidden_folders(), [])
+
+    def test_pending_writes_are_bounded(self):
+        write_season = self.series._write_season
+        pending = []
+        max_pending = 0
+
+        async def slow_write_season(*args):
+            nonlocal max_pending
+            pending.append(args)
+            max_pending = max(max_pending, len(pending))
+            await asyncio.sleep(0.01)
+            await write_season(*args)
+            pending.remove(args)
+
+        self.series._write_season = slow_write_season
+        self._write(*(self._get_season(f'Season {number}', [number]) for number in range(MAX_PENDING_SEASON_WRITES * 3)))
+        self.assertEqual(max_pending, MAX_PENDING_SEASON_WRITES)
+        self.assertEqual(len(self._read_series()), MAX_PENDING_SEASON_WRITES * 3)
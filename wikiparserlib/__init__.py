@@ -32,7 +32,7 @@ Import all parts from wikiparserlib here
    http://google.github.io/styleguide/pyguide.html
 """
 from ._version import __version__
-from .wikiparserlib import WikipediaSeries
+from .wikiparserlib import WikipediaSeries, AsyncWikipediaSeries, scrape_many_async, scrape_show, scrape_many
 __author__ = '''Niko Izsak <izsak.niko@gmail.com>'''
 __docformat__ = '''google'''
 __date__ = '''28-02-2021'''
@@ -45,3 +45,7 @@ __status__ = '''Development'''  # "Prototype", "Development", "Production".
 # This is to 'use' the module(s), so lint doesn't complain
 assert __version__
 assert WikipediaSeries
+assert AsyncWikipediaSeries
+assert scrape_many_async
+assert scrape_show
+assert scrape_many
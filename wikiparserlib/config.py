@@ -34,3 +34,6 @@ Configuration for wikiparserlib.
 WIKIPEDIA_HOST_URL = "https://en.wikipedia.org"
 WIKIPEDIA_API_URI = '/w/api.php'
 WIKIPEDIA_SEARCH_API = WIKIPEDIA_HOST_URL+WIKIPEDIA_API_URI
+
+RESULTS_DIRECTORY = './results'
+UNTITLED_SEASON_FOLDER = 'Untitled'
@@ -31,16 +31,31 @@ http://google.github.io/styleguide/pyguide.html
 
 """
 
+import asyncio
+import io
 import logging
-import json
+import multiprocessing
 import os
 import shutil
-from dataclasses import dataclass
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+from typing import NamedTuple, Optional
 import re
+import aiofiles
+import aiohttp
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from lxml import etree
 
+from ._version import __version__
 from .config import (
+    RESULTS_DIRECTORY,
+    UNTITLED_SEASON_FOLDER,
     WIKIPEDIA_SEARCH_API
 )
 
@@ -60,15 +75,87 @@ LOGGER_BASENAME = '''wikiparserlib'''
 LOGGER = logging.getLogger(LOGGER_BASENAME)
 LOGGER.addHandler(logging.NullHandler())
 
+# HTML classes used to find the elements of the episode list pages
+SEASONS_TABLE_CLASSES = frozenset({'wikitable', 'plainrowheaders'})
+EPISODE_TABLE_CLASSES = frozenset({'wikitable', 'plainrowheaders', 'wikiepisodetable'})
+SEASON_HEADLINE_CLASS = 'mw-headline'
 
-@dataclass
-class SearchResult:
-    """Data class for search results."""
+# XPath expressions used to read the episode tables, compiled once at import time
+EPISODE_ROWS_XPATH = etree.XPath('.//tr[contains(concat(" ", normalize-space(@class), " "), " vevent ")]')
+COLUMN_HEADERS_XPATH = etree.XPath('(.//tr)[1]//th[@scope="col"]')
+ROW_CELLS_XPATH = etree.XPath('./th | ./td')
+
+# Number of seasons being written at the same time, bounding how far ahead of the writes seasons are parsed
+MAX_PENDING_SEASON_WRITES = 4
+
+# Retries of transient wikipedia failures, shared by the sync and async clients
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Page title patterns per query type, compiled once at import time
+REGEX_MAP = {
+    'episode_list': re.compile(r'^List of (?P<result_title>.+) episodes'),
+    'miniseries': re.compile(r'^(?P<result_title>.+)\(miniseries\)$')
+}
+
+
+def _get_session():
+    """Get a requests session that keeps connections to wikipedia alive and retries transient failures."""
+    retries = Retry(total=MAX_RETRIES,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUSES,
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retries)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.headers.update(make_headers(accept_encoding=True, user_agent=f'wikiparserlib/{__version__.strip()}'))
+    return session
+
+
+SESSION = _get_session()
+
+
+@lru_cache(maxsize=256)
+def _http_get_json(url, parameters):
+    """Get the decoded json body of a GET request, cached by url and parameters.
+
+    Args:
+        url (str): The url to request
+        parameters (tuple): The query parameters as a sorted tuple of (key, value) pairs
+
+    """
+    response = SESSION.get(url, params=dict(parameters))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@lru_cache(maxsize=16)
+def _http_get_content(url):
+    """Get the raw body of a GET request, cached by url.
+
+    Episode list pages can be several MB each, so only the most recent few are kept.
+
+    """
+    response = SESSION.get(url)
+    response.raise_for_status()
+    return response.content
+
+
+def _get_umask():
+    """Get the umask of the process, which can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+class SearchResult(NamedTuple):
+    """Named tuple for search results."""
 
     title: str
     url: str
     query: str
-    query_type: str
+    query_type: Optional[str]
 
 
 class LoggerMixin():
@@ -78,28 +165,16 @@ class LoggerMixin():
         self._logger = logging.getLogger(f'{LOGGER_BASENAME}.{self.__class__.__name__}')
 
 
-class WikipediaSeries(LoggerMixin):
-    """Wiki series class."""
+class BaseWikipediaSeries(LoggerMixin):
+    """Search, parse and write logic shared by the wiki series classes."""
 
     def __init__(self) -> None:
         super().__init__()
         self.search_url = WIKIPEDIA_SEARCH_API
-        self._seasons = []
         self.title = None
         self.url = None
         self.query_type = None
 
-    def __str__(self):
-        return f'series seasons: {self.seasons}'
-
-    @property
-    def seasons(self):
-        """List of Season objects."""
-        if self._seasons == []:
-            soup = self._get_soup_by_url(self.url)
-            self._seasons = self._parse_seasons_and_episodes_from_soup(soup)
-        return self._seasons
-
     @staticmethod
     def _get_query_map(name):
         query_map = {
@@ -111,130 +186,204 @@ class WikipediaSeries(LoggerMixin):
 
     @staticmethod
     def _get_regex_map():
-        regex_map = {
-            'episode_list': '^List of (?P<result_title>.+) episodes',
-            'miniseries': '^(?P<result_title>.+)\\(miniseries\\)$'
-        }
-        return regex_map
+        return REGEX_MAP
 
     @staticmethod
     def _check_for_match_in_result(results):
-        """Check for exact match in results."""
+        """Check for a match in results, ignoring case and surrounding whitespace and allowing a disambiguated title.
+
+        A disambiguated title is the query followed by a parenthesized qualifier, like "Name (TV series)".
+
+        """
         if len(results) > 0:
-            if (len(results) == 1 or results[0].title == results[0].query):
+            query = results[0].query.casefold().strip()
+            title = results[0].title.casefold().strip()
+            if len(results) == 1 or title == query or title.startswith(f'{query} ('):
                 return results[0]
         return False
 
     def _parse_series_title_and_type(self, result):
         """Parse and set the serise title and the type (miniseries or normal) from the found page title."""
         for query_type, regex in self._get_regex_map().items():
-            regex_match = re.match(r'{}'.format(regex), result.title)
+            regex_match = regex.match(result.title)
             if regex_match:
-                self._logger.debug("found regex match {}:{}".format(regex, result.title))
+                self._logger.debug("found regex match {}:{}".format(regex.pattern, result.title))
                 title = regex_match.group('result_title').strip()
                 return title, query_type
-            self._logger.debug("regex did not match: {}".format(regex))
+            self._logger.debug("regex did not match: {}".format(regex.pattern))
         return result.title, None
 
-    def search_by_name(self, name):
-        """Search wikipedia for a tv show by name.
-
-        Args:
-            name (str): The name of the tv show to search for
+    def _pick_search_result(self, results_by_type):
+        """Pick the first non empty result in query type order and set it as the match if it is one.
 
-        Return:
-            List[SearchResults]: A list of search result or None if nothing was found.
+        A failed search is None, and only reported as an error when no query type returned any results.
 
         """
-        for query_type, query in self._get_query_map(name).items():
-            self._logger.debug('Searching for {} with type:{}'.format(name, query_type))
-            result = self._search(query)
-            if result:
+        failed_query_types = []
+        for query_type, result in results_by_type:
+            if result is None:
+                failed_query_types.append(query_type)
+            elif result:
+                self._logger.debug('Using results of query type:{}'.format(query_type))
+                if self._check_for_match_in_result(result):
+                    self.set_match(result[0])
                 return result
+        if failed_query_types:
+            self._logger.error('Search failed for query types:{}'.format(', '.join(failed_query_types)))
         return []
 
-    def _search(self, query):
+    @staticmethod
+    def _get_search_parameters(query):
         parameters = {'action': 'opensearch',
                       'format': 'json',
                       'formatversion': '2',
                       'profile': 'strict',
                       'limit': '3',
                       'search': query}
+        return parameters
 
-        response = requests.get(self.search_url, params=parameters)
-        if response.ok:
-            result = [SearchResult(*args, query, None) for args in zip(response.json()[1], response.json()[3])]
-            if self._check_for_match_in_result(result):
-                self.set_match(result[0])
-                return [result[0]]
-            return result
-        self._logger.error('Request failed with code {} and message {}'.format(response.code, response.text))
-        return None
+    def _parse_search_response(self, query, data):
+        """Build the search results from the opensearch response data."""
+        result = [SearchResult(*args, query, None) for args in zip(data[1], data[3])]
+        match = self._check_for_match_in_result(result)
+        if match:
+            return [match]
+        return result
+
+    def set_match(self, match):
+        """Set the selected result as a match for the query, and parse the dat."""
+        self.title, self.query_type = self._parse_series_title_and_type(match)
+        self.url = match.url
 
     @staticmethod
-    def _get_soup_by_url(url):
-        """Get a BeautifulSoup object from URL."""
-        html_response = requests.get(url)
-        soup = BeautifulSoup(html_response.text, 'html.parser')
-        return soup
+    def _get_classes(element):
+        return set(element.get('class', '').split())
 
     @staticmethod
-    def _parse_seasons_from_soup(soup):  # Not used.
+    def _get_text(element):
+        return ''.join(element.itertext()).strip()
+
+    def _parse_seasons_from_html(self, html):  # Not used.
         """Parse the season numbers from the first season table."""
-        season_list = []
-        table = soup.find("table", {"class": "wikitable plainrowheaders"})
-        t_headers = table.find_all("th")
-        for header in t_headers:
-            season = header.find("a")
-            if season:
-                season_list.append(season.contents[0])
-        return season_list
-
-    def _parse_seasons_and_episodes_from_soup(self, soup):
-        """Parse the season and episode tables from the tv show soup object."""
-        season_list = []
-        tables = soup.find_all("table", {"class": "wikitable plainrowheaders wikiepisodetable"})
-        for table in tables:
-            if self.query_type == "miniseries":
-                season_title = "Miniseries"
-            else:
-                season_header = table.find_previous_sibling('h3')
-                season_title = season_header.find("span", {"class": "mw-headline"}).get_text(strip=True)
-            season = Season(season_title)
-            season.episodes = self._parse_html_table_to_json(table)
-            season_list.append(season)
-        return season_list
+        tree = etree.fromstring(html, etree.HTMLParser())
+        for table in tree.iter('table'):
+            if SEASONS_TABLE_CLASSES <= self._get_classes(table):
+                return [self._get_text(link) for link in table.xpath('.//th//a[1]')]
+        return []
 
-    @staticmethod
-    def _parse_html_table_to_json(table):
+    def _get_season_title(self, heading):
+        """Get the season title from the headline of a season heading, or from the whole heading if it has none."""
+        for span in heading.iter('span'):
+            if SEASON_HEADLINE_CLASS in self._get_classes(span):
+                return self._get_text(span)
+        return self._get_text(heading)
+
+    def _iter_seasons_and_episodes_from_html(self, html):
+        """Parse the season and episode tables from the tv show page in a single pass over the document.
+
+        Every episode table is paired with the last section heading seen before it in document order, a season (h3)
+        heading or a top level (h2) one like "Specials", and each season is yielded as soon as its table is parsed.
+        Handled elements and everything before them are dropped from the tree as the parse goes.
+
+        """
+        season_title = None
+        elements = etree.iterparse(io.BytesIO(html), events=('end',), tag=('h2', 'h3', 'table'), html=True)
+        for _, element in elements:
+            season = None
+            if element.tag in ('h2', 'h3'):
+                season_title = self._get_season_title(element)
+            elif EPISODE_TABLE_CLASSES <= self._get_classes(element):
+                season = Season("Miniseries" if self.query_type == "miniseries" else season_title)
+                season.episodes = self._parse_html_table_to_json(element)
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            if season is not None:
+                yield season
+
+    def _parse_html_table_to_json(self, table):
         """Parse HTML table and extract headers as keys and rows as values in a dictionary."""
-        table_data = [[cell.text.strip('"') for cell in row] for row in table("tr", {"class": "vevent"})]
-        table_headers = [cell.text.strip() for cell in table.find("tr")("th", {"scope": "col"})]
-        results_list = []
-        for row in table_data:
-            res_dict = {}
-            for idx, item in enumerate(row):
-                res_dict[table_headers[idx]] = item
-            results_list.append(res_dict)
-        return json.dumps(results_list, indent=4)
+        table_headers = [self._get_text(cell) for cell in COLUMN_HEADERS_XPATH(table)]
+        rows = ([self._get_text(cell).strip('"') for cell in ROW_CELLS_XPATH(row)] for row in EPISODE_ROWS_XPATH(table))
+        results_list = [dict(zip(table_headers, row)) for row in rows]
+        return orjson.dumps(results_list, option=orjson.OPT_INDENT_2).decode()
 
-    def set_match(self, match):
-        """Set the selected result as a match for the query, and parse the dat."""
-        self.title, self.query_type = self._parse_series_title_and_type(match)
-        self.url = match.url
+    async def _write_async(self, seasons):
+        """Write the seasons concurrently in a temporary folder and move it over the series folder when done.
 
-    def write_to_file_system(self):
-        """Write series data to the file system. Create folder tree and write episode data as json."""
-        self._logger.info("Writing search results to file system for {}".format(self.title))
-        for season in self.seasons:
-            self._logger.debug("writing results to file sysytem for season: {}".format(season.number))
-            directory = os.path.dirname(f'./results/{self.title}/{season.number}/')
-            if os.path.exists(directory):
-                self._logger.warning("Season folder already exists {}, overwriting it.".format(directory))
-                self.delete_dir_tree(directory)
-            os.makedirs(directory)
-            with open(f'{directory}/episodes.json', 'w') as episodes_file:
-                episodes_file.write(season.episodes)
+        Seasons are taken from the iterable as write slots free up, so a lazy iterable is only consumed a few seasons
+        ahead of the writes. The temporary folder is removed if anything fails, leaving the existing series folder
+        untouched.
+
+        """
+        loop = asyncio.get_running_loop()
+        series_directory = os.path.join(RESULTS_DIRECTORY, self.title)
+        await loop.run_in_executor(None, partial(os.makedirs, RESULTS_DIRECTORY, exist_ok=True))
+        temp_directory = await loop.run_in_executor(None, partial(tempfile.mkdtemp,
+                                                                  prefix=f'.{self.title.replace(os.sep, "_")}.',
+                                                                  dir=RESULTS_DIRECTORY))
+        pending_writes = asyncio.Semaphore(MAX_PENDING_SEASON_WRITES)
+
+        async def write(season, previous_write):
+            try:
+                await self._write_season(temp_directory, season, previous_write)
+            finally:
+                pending_writes.release()
+
+        writes = {}
+        try:
+            os.chmod(temp_directory, 0o777 & ~_get_umask())
+            for season in seasons:
+                await pending_writes.acquire()
+                writes[season.number] = asyncio.ensure_future(write(season, writes.get(season.number)))
+            await asyncio.gather(*writes.values())
+            await loop.run_in_executor(None, partial(os.makedirs, os.path.dirname(series_directory), exist_ok=True))
+            self._replace_dir_tree(temp_directory, series_directory)
+        except BaseException:
+            await asyncio.gather(*writes.values(), return_exceptions=True)
+            await loop.run_in_executor(None, self.delete_dir_tree, temp_directory)
+            raise
+
+    async def _write_season(self, directory, season, previous_write=None):
+        """Create the season folder under the directory and write the season episodes as json in it.
+
+        A season with the same title as an earlier one waits for the earlier write and then overwrites it.
+
+        """
+        folder = season.number or UNTITLED_SEASON_FOLDER
+        season_directory = os.path.join(directory, folder)
+        if previous_write is not None:
+            self._logger.warning("Season folder already exists {}, overwriting it.".format(folder))
+            await previous_write
+        self._logger.debug("writing results to file sysytem for season: {}".format(folder))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(os.makedirs, season_directory, exist_ok=True))
+        episodes_path = os.path.join(season_directory, 'episodes.json')
+        async with aiofiles.open(episodes_path, 'w', encoding='utf-8') as episodes_file:
+            await episodes_file.write(season.episodes)
+
+    def _replace_dir_tree(self, source_path, dir_path):
+        """Move a directory tree over another one, deleting the replaced tree in a background thread.
+
+        The replaced tree is moved aside first, so there is a short window where dir_path does not exist. It is
+        moved back if the new tree cannot be moved in.
+
+        """
+        old_path = f'{source_path}.old'
+        try:
+            os.replace(dir_path, old_path)
+        except FileNotFoundError:
+            old_path = None
+        else:
+            self._logger.warning("Series folder already exists {}, overwriting it.".format(dir_path))
+        try:
+            os.replace(source_path, dir_path)
+        except OSError:
+            if old_path:
+                os.replace(old_path, dir_path)
+            raise
+        if old_path:
+            threading.Thread(target=self.delete_dir_tree, args=(old_path,)).start()
 
     def delete_dir_tree(self, dir_path):
         """Delete directory tree."""
@@ -244,6 +393,262 @@ class WikipediaSeries(LoggerMixin):
             self._logger.error("Error: {}:{}".format(dir_path, error.strerror))
 
 
+class WikipediaSeries(BaseWikipediaSeries):
+    """Wiki series class."""
+
+    def __str__(self):
+        return f'series seasons: {self.seasons}'
+
+    @cached_property
+    def seasons(self):
+        """List of Season objects."""
+        return list(self._iter_seasons_and_episodes_from_html(self._get_html_by_url(self.url)))
+
+    def iter_seasons(self):
+        """Iterate over the seasons, parsing them one at a time from the page if they are not loaded yet.
+
+        Return:
+            Iterator[Season]: The seasons of the series.
+
+        """
+        if 'seasons' in self.__dict__:
+            return iter(self.seasons)
+        return self._iter_seasons_and_episodes_from_html(self._get_html_by_url(self.url))
+
+    @classmethod
+    def invalidate(cls):
+        """Clear the cached wikipedia responses shared by all instances."""
+        _http_get_json.cache_clear()
+        _http_get_content.cache_clear()
+
+    def search_by_name(self, name):
+        """Search wikipedia for a tv show by name.
+
+        Args:
+            name (str): The name of the tv show to search for
+
+        Return:
+            List[SearchResults]: A list of search result or None if nothing was found.
+
+        """
+        query_map = self._get_query_map(name)
+        with ThreadPoolExecutor(max_workers=len(query_map)) as executor:
+            futures = {}
+            for query_type, query in query_map.items():
+                self._logger.debug('Searching for {} with type:{}'.format(name, query_type))
+                futures[query_type] = executor.submit(self._search, query)
+            results = ((query_type, future.result()) for query_type, future in futures.items())
+            return self._pick_search_result(results)
+
+    def _search(self, query):
+        parameters = self._get_search_parameters(query)
+        try:
+            data = _http_get_json(self.search_url, tuple(sorted(parameters.items())))
+        except requests.HTTPError as error:
+            self._logger.debug('Request failed with code {} and message {}'.format(error.response.status_code,
+                                                                                  error.response.text))
+            return None
+        return self._parse_search_response(query, data)
+
+    @staticmethod
+    def _get_html_by_url(url):
+        """Get the raw HTML of a page from URL."""
+        return _http_get_content(url)
+
+    def write_to_file_system(self):
+        """Write series data to the file system. Create folder tree and write episode data as json."""
+        self._logger.info("Writing search results to file system for {}".format(self.title))
+        asyncio.run(self._write_async(self.iter_seasons()))
+
+
+class AsyncWikipediaSeries(BaseWikipediaSeries):
+    """Wiki series class with an asyncio interface.
+
+    An aiohttp session can be passed in to share its connection pool between many series, otherwise one is created
+    on first use and closed by close() or when leaving the async context manager.
+
+    """
+
+    def __init__(self, session=None) -> None:
+        super().__init__()
+        self._seasons = None
+        self._client = session
+        self._owns_client = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @property
+    def seasons(self):
+        """List of Season objects, None until load_seasons is awaited."""
+        return self._seasons
+
+    @staticmethod
+    def get_client_session():
+        """Get an aiohttp session with a pooled connector for wikipedia requests."""
+        connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+        return aiohttp.ClientSession(connector=connector,
+                                     headers={'User-Agent': f'wikiparserlib/{__version__.strip()}'})
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = self.get_client_session()
+        return self._client
+
+    async def close(self):
+        """Close the aiohttp session if it was created by this instance."""
+        if self._owns_client and self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def search_by_name(self, name):
+        """Search wikipedia for a tv show by name.
+
+        Args:
+            name (str): The name of the tv show to search for
+
+        Return:
+            List[SearchResults]: A list of search result or None if nothing was found.
+
+        """
+        query_map = self._get_query_map(name)
+        self._logger.debug('Searching for {} with types:{}'.format(name, ', '.join(query_map)))
+        results = await asyncio.gather(*(self._search(query) for query in query_map.values()))
+        return self._pick_search_result(zip(query_map, results))
+
+    async def _get(self, url, params=None):
+        """Get a response and its body, retrying transient failures with backoff like the sync session does.
+
+        Return:
+            tuple: The last aiohttp response, which can still have a failed status once retries run out, and its body.
+
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._get_client().get(url, params=params) as response:
+                    body = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return response, body
+            backoff = RETRY_BACKOFF_FACTOR * 2 ** attempt
+            self._logger.debug('Retrying request to {} in {}s'.format(url, backoff))
+            await asyncio.sleep(backoff)
+        return None, None
+
+    async def _search(self, query):
+        parameters = self._get_search_parameters(query)
+        response, body = await self._get(self.search_url, params=parameters)
+        if response.status >= 400:
+            self._logger.debug('Request failed with code {} and message {}'.format(response.status,
+                                                                                  body.decode(errors='replace')))
+            return None
+        return self._parse_search_response(query, orjson.loads(body))
+
+    async def _get_html_by_url(self, url):
+        """Get the raw HTML of a page from URL."""
+        html_response, html = await self._get(url)
+        html_response.raise_for_status()
+        return html
+
+    async def load_seasons(self):
+        """Fetch and parse the seasons of the matched series.
+
+        Return:
+            List[Season]: The seasons of the series.
+
+        """
+        if self._seasons is None:
+            html = await self._get_html_by_url(self.url)
+            self._seasons = list(self._iter_seasons_and_episodes_from_html(html))
+        return self._seasons
+
+    async def write_to_file_system(self):
+        """Write series data to the file system. Create folder tree and write episode data as json."""
+        self._logger.info("Writing search results to file system for {}".format(self.title))
+        await self._write_async(await self.load_seasons())
+
+
+async def scrape_many_async(names, concurrency=20):
+    """Search for many tv shows and write the seasons of the ones matched to the file system.
+
+    Args:
+        names (list): The names of the tv shows to scrape
+        concurrency (int): The maximum number of tv shows being scraped at the same time
+
+    Return:
+        List[AsyncWikipediaSeries]: The series objects in the order of the names, None for the ones that failed.
+
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def scrape(session, name):
+        async with semaphore:
+            series = AsyncWikipediaSeries(session)
+            try:
+                await series.search_by_name(name)
+                if series.url:
+                    await series.write_to_file_system()
+                else:
+                    LOGGER.warning('No exact match found for {}, skipping it.'.format(name))
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as error:
+                LOGGER.error('Scraping {} failed, skipping it: {}'.format(name, error))
+                return None
+            return series
+
+    async with AsyncWikipediaSeries.get_client_session() as session:
+        return await asyncio.gather(*(scrape(session, name) for name in names))
+
+
+def _close_session():
+    """Drop the connections a worker process inherited from its parent, new ones are opened on demand."""
+    SESSION.close()
+
+
+def scrape_show(name):
+    """Search for a tv show and parse its seasons.
+
+    Args:
+        name (str): The name of the tv show to scrape
+
+    Return:
+        dict: The series title and its seasons with their number and episodes, or None if no match was found or
+            scraping failed.
+
+    """
+    series = WikipediaSeries()
+    try:
+        series.search_by_name(name)
+        if not series.url:
+            LOGGER.warning('No exact match found for {}, skipping it.'.format(name))
+            return None
+        seasons = [{'number': season.number, 'episodes': season.episodes} for season in series.iter_seasons()]
+    except (requests.RequestException, OSError) as error:
+        LOGGER.error('Scraping {} failed, skipping it: {}'.format(name, error))
+        return None
+    return {'title': series.title, 'seasons': seasons}
+
+
+def scrape_many(names, workers=None):
+    """Scrape many tv shows in parallel worker processes.
+
+    Args:
+        names (list): The names of the tv shows to scrape
+        workers (int): The number of worker processes, defaults to the number of cpus
+
+    Return:
+        list: The result of scrape_show for each name, in the order of the names, None for the ones that failed.
+
+    """
+    with multiprocessing.Pool(workers or os.cpu_count(), initializer=_close_session) as pool:
+        return pool.map(scrape_show, names)
+
+
 class Season:
     """Season class.
 
@@ -263,7 +668,7 @@ class Season:
         episodes = []
         for episode in self.episodes:
             episodes.append(episode.__dict__)
-        return json.dumps(episodes)
+        return orjson.dumps(episodes).decode()
 
 
 class Episode: